@@ -12,7 +12,8 @@ from ..client import Client, ClientConfigChangedEvent
 from ..config.config import PrinterConfig
 from ..config.manager import ConfigManager
 from ..lifetime.lifetime_manager import LifetimeManager, LifetimeType
-from ..protocol import ClientEvent, DemandEvent
+from ..protocol import ClientEvent, DemandEvent, WireFormat
+from ..protocol.client_events import PingEvent
 from ..protocol.server_events import ServerEvent, ConnectEvent
 from ...connection.connection import (Connection, ConnectionConnectedEvent,
                                       ConnectionDisconnectEvent,
@@ -56,6 +57,9 @@ class Instance(AsyncStoppable, EventLoopProvider, Generic[TClient, TConfig], ABC
 
     allow_setup = False
     reconnect_timeout: float = 5.0
+    batch_client_events: bool = False
+    wire_format: WireFormat = WireFormat.JSON
+    compress_events: bool = False
 
     event_bus: EventBus[Event]
     event_bus_response: EventBusPredicateResponseMiddleware
@@ -75,10 +79,11 @@ class Instance(AsyncStoppable, EventLoopProvider, Generic[TClient, TConfig], ABC
 
     # Keep track of events sent too early to be processed, so we can process them later.
     server_event_backlog: List[Tuple[ConnectionPollEvent]]
-    client_event_backlog: List[Tuple[TClient, ClientEvent]]
+    client_event_backlog: List[Tuple[ClientEvent, TClient]]
 
     def __init__(self, config_manager: ConfigManager[TConfig], allow_setup=False,
-                 reconnect_timeout=5.0) -> None:
+                 reconnect_timeout=5.0, batch_client_events=False, wire_format=WireFormat.JSON,
+                 compress_events=False) -> None:
 
         AsyncStoppable.__init__(self)
         EventLoopProvider.__init__(self)
@@ -99,6 +104,9 @@ class Instance(AsyncStoppable, EventLoopProvider, Generic[TClient, TConfig], ABC
 
         self.allow_setup = allow_setup
         self.reconnect_timeout = reconnect_timeout
+        self.batch_client_events = batch_client_events
+        self.wire_format = wire_format
+        self.compress_events = compress_events
 
         self.event_bus.on(ServerEvent, self.on_server_event, generic=True)
 
@@ -110,6 +118,9 @@ class Instance(AsyncStoppable, EventLoopProvider, Generic[TClient, TConfig], ABC
 
     def _init_connection(self):
         self.connection = Connection(event_loop_provider=self)
+        self.connection.batch_events = self.batch_client_events
+        self.connection.preferred_wire_format = self.wire_format
+        self.connection.compress_events = self.compress_events
 
         self.connection.event_bus.on(ConnectionConnectedEvent, self.on_connect)
         self.connection.event_bus.on(
@@ -389,14 +400,61 @@ class Instance(AsyncStoppable, EventLoopProvider, Generic[TClient, TConfig], ABC
         Called when a client event is dispatched out.
         """
 
+        if not self.is_client_event_allowed(event, client):
+            return
+
+        if self.batch_client_events and not self.connection.is_connected():
+            # Sent as a single frame once connected again, send_event still handles the disconnect.
+            self.backlog_client_event(event, client)
+
+        await self.connection.send_event(client, event)
+
+    def backlog_client_event(self, event: ClientEvent, client: Client[TConfig]):
+        """
+        Keep track of an event that could not be sent, only the latest event
+        of each type is kept per client as older ones are outdated by then.
+        """
+
+        # Pings are only meaningful for the connection they are sent on.
+        if isinstance(event, PingEvent):
+            return
+
+        for i, (backlogged_event, backlogged_client) in enumerate(self.client_event_backlog):
+            if type(backlogged_event) is type(event) and backlogged_client is client:
+                del self.client_event_backlog[i]
+                break
+
+        self.client_event_backlog.append((event, client))
+
+    async def consume_client_event_backlog(self, client: Client[TConfig]):
+        """
+        Sends the events backlogged for a client in a single frame, they
+        stay backlogged if the connection is gone again by then.
+        """
+
+        if not self.connection.is_connected():
+            return
+
+        events = []
+
+        for backlogged_event, backlogged_client in list(self.client_event_backlog):
+            if backlogged_client is not client:
+                continue
+
+            self.client_event_backlog.remove((backlogged_event, backlogged_client))
+
+            if self.is_client_event_allowed(backlogged_event, client):
+                events.append(backlogged_event)
+
+        await self.connection.send_events(client, events)
+
+    @staticmethod
+    def is_client_event_allowed(event: ClientEvent, client: Client[TConfig]) -> bool:
         if not isinstance(event, ClientEvent):
             raise InstanceException(f"Expected ClientEvent but got {event}")
 
         # If the client is in setup only a certain subset of events is allowed
-        if client.config.is_pending() and not event.event_type.is_allowed_in_setup():
-            return
-
-        await self.connection.send_event(client, event)
+        return not client.config.is_pending() or event.event_type.is_allowed_in_setup()
 
     @abstractmethod
     def get_clients(self) -> Iterable[TClient]:
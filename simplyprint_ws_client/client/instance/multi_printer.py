@@ -28,6 +28,8 @@ class MultiPrinterClientEvents(Enum):
 
 
 class MultiPrinterAddPrinterEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = MultiPrinterClientEvents.ADD_PRINTER
 
     def __init__(self, config: PrinterConfig, allow_setup: bool = False) -> None:
@@ -41,6 +43,8 @@ class MultiPrinterAddPrinterEvent(ClientEvent):
 
 
 class MultiPrinterRemovePrinterEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = MultiPrinterClientEvents.REMOVE_PRINTER
 
     def __init__(self, config: PrinterConfig) -> None:
@@ -254,7 +258,7 @@ class MultiPrinter(Instance[TClient, TConfig]):
                     client.printer.mark_all_changed_dirty()
 
                     await self.consume_backlog(self.server_event_backlog, self.on_poll_event)
-                    await self.consume_backlog(self.client_event_backlog, self.on_client_event)
+                    await self.consume_client_event_backlog(client)
                 else:
                     self.logger.debug(
                         f"Popped client {client.config.unique_id} from clients due to failed adding, status false.")
@@ -42,7 +42,7 @@ class SinglePrinter(Instance[TClient, TConfig]):
         # Mark certain events to always be sent to the server
         self.client.printer.mark_all_changed_dirty()
 
-        await self.consume_backlog(self.client_event_backlog, self.on_client_event)
+        await self.consume_client_event_backlog(self.client)
 
     async def on_client_event(self, event: ClientEvent, client: Client[TConfig]):
         # Do not send for_client identifier for a single printer connection
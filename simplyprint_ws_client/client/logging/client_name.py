@@ -10,9 +10,23 @@ if TYPE_CHECKING:
 
 
 class ClientName(str):
+    """
+    Dynamic logger name of a client, composed of the config unique id and a stack of names.
+
+    This has to remain a subclass of str as the logging module rejects other names, but the
+    underlying str value is only the unique id at construction time. All comparisons
+    are therefore made against the composed name instead.
+    """
+
     stack: List[str]
     config: 'Config'
 
+    # The joined name is cached as it is stringified far more often (logging)
+    # than the stack changes, it is rebuilt when the stack or unique id changes.
+    _cached_str: Optional[str] = None
+    _cached_hash: Optional[int] = None
+    _cached_unique_id: Optional[str] = None
+
     def __new__(cls, config: 'Config') -> str:
         return super().__new__(cls, config.unique_id)
 
@@ -21,10 +35,33 @@ class ClientName(str):
         self.stack = []
 
     def __str__(self) -> str:
-        return ".".join([self.config.unique_id] + self.stack)
+        if self._cached_str is None or self._cached_unique_id != self.config.unique_id:
+            self._cached_unique_id = self.config.unique_id
+            self._cached_str = ".".join([self._cached_unique_id] + self.stack)
+            self._cached_hash = hash(self._cached_str)
+
+        return self._cached_str
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        # Ensure the cache is up-to-date.
+        str(self)
+        return self._cached_hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, str):
+            return NotImplemented
+
+        return str(self) == str(other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, str):
+            return NotImplemented
+
+        return str(self) != str(other)
+
+    def _invalidate(self) -> None:
+        self._cached_str = None
+        self._cached_hash = None
 
     def copy(self) -> Self:
         return ClientName(self.config).push_all(self.stack)
@@ -36,10 +73,12 @@ class ClientName(str):
 
     def push(self, name: str) -> Self:
         self.stack.append(name)
+        self._invalidate()
         return self
 
     def pop(self) -> Self:
         self.stack.pop()
+        self._invalidate()
         return self
 
     def peek(self) -> Optional[str]:
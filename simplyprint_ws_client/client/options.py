@@ -6,6 +6,7 @@ from .config import Config, ConfigManager, PrinterConfig
 from .config import ConfigManagerType
 from .factory import TClientFactory
 from .instance import Instance, MultiPrinter, SinglePrinter
+from .protocol import WireFormat
 from ..helpers.url_builder import SimplyPrintBackend
 from ..utils.event_loop_runner import EventLoopBackend
 
@@ -51,6 +52,15 @@ class ClientOptions(NamedTuple):
     # Sentry DSN for sentry logging.
     sentry_dsn: Optional[str] = None
 
+    # Send backlogged client events as a single frame, requires server support.
+    batch_client_events: bool = False
+
+    # Frame serialization, MSGPACK requires server support and the msgpack extra.
+    wire_format: WireFormat = WireFormat.JSON
+
+    # Negotiate permessage-deflate and compress large infrequent events (machine data, plugins, etc.).
+    compress_events: bool = False
+
     def is_valid(self) -> bool:
         return self.client_t is not None and self.config_t is not None
 
@@ -62,4 +72,7 @@ class ClientOptions(NamedTuple):
 
     def create_instance(self) -> Instance:
         return self.mode.get_class()(config_manager=self.create_config_manager(), allow_setup=self.allow_setup,
-                                     reconnect_timeout=self.reconnect_timeout)
+                                     reconnect_timeout=self.reconnect_timeout,
+                                     batch_client_events=self.batch_client_events,
+                                     wire_format=self.wire_format,
+                                     compress_events=self.compress_events)
@@ -5,3 +5,4 @@ from .client_events import ClientEvent
 from .demand_events import DemandEvent
 from .event_factory import EventFactory
 from .server_events import ServerEvent
+from .wire_format import WireFormat
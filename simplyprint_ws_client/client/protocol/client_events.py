@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Any, Dict, Generator, Optional, Tuple, TYPE_CHECKING, Union, Callable, List
+from typing import Any, ClassVar, Dict, Generator, Optional, Tuple, TYPE_CHECKING, Union, Callable, List
 
+from .wire_format import WireFormat
 from ...events.event import Event
 from ...helpers.intervals import IntervalTypes, IntervalTypeRef, IntervalException
 
@@ -69,13 +70,44 @@ class ClientEventMode(Enum):
 _TDataGenerator = Generator[Tuple[str, Any, Optional[Callable]], None, None]
 
 
+def _iter_data(data: Dict[str, Any], hooks: List[Callable]) -> _TDataGenerator:
+    """Yield data in the build() format, the hooks are run as a single callback of the first item."""
+
+    def run_hooks() -> None:
+        for hook in hooks:
+            hook()
+
+    callback = run_hooks if hooks else None
+
+    for key, value in data.items():
+        yield key, value, callback
+        callback = None
+
+
 class ClientEvent(Event):
-    event_type: PrinterEvent
-    interval_type: Optional[IntervalTypeRef] = None
+    __slots__ = ("_on_sent_hooks", "for_client", "_data", "_state")
+
+    event_type: ClassVar[PrinterEvent]
+    interval_type: ClassVar[Optional[IntervalTypeRef]] = None
+
+    # Large and infrequent events are compressed when the connection negotiated permessage-deflate.
+    compress: ClassVar[bool] = False
+
+    # Resolved once per subclass, see __init_subclass__.
+    _event_name: ClassVar[Optional[str]] = None
 
     _on_sent_hooks: List[Callable]
-    for_client: Optional[Union[str, int]] = None
-    data: Optional[Dict[str, Any]] = None
+    for_client: Optional[Union[str, int]]
+    _data: Optional[Dict[str, Any]]
+
+    # State to build data from once it is accessed, see from_state.
+    _state: Optional["PrinterState"]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if (event_type := getattr(cls, "event_type", None)) is not None:
+            cls._event_name = event_type.value
 
     def __init__(
             self,
@@ -88,6 +120,8 @@ class ClientEvent(Event):
         """
         self._on_sent_hooks = []
         self.for_client = for_client
+        self._data = None
+        self._state = None
 
         if data is None:
             return
@@ -113,17 +147,32 @@ class ClientEvent(Event):
             if callback is not None:
                 self._on_sent_hooks.append(callback)
 
-    def generate(self) -> Generator[Tuple[str, Any], None, None]:
-        yield "type", self.get_name()
+    @property
+    def data(self) -> Optional[Dict[str, Any]]:
+        if self._state is not None:
+            state, self._state = self._state, None
+            self._data = self.build_data(state, self._on_sent_hooks) or None
+
+        return self._data
+
+    @data.setter
+    def data(self, data: Optional[Dict[str, Any]]) -> None:
+        self._state = None
+        self._data = data
+
+    def as_dict(self) -> Dict[str, Any]:
+        message = {"type": self.get_name()}
 
         if self.for_client is not None and self.for_client != 0:
-            yield "for", self.for_client
+            message["for"] = self.for_client
 
         if self.data is not None:
-            yield "data", self.data
+            message["data"] = self.data
 
-    def as_dict(self) -> Dict[str, Any]:
-        return dict(self.generate())
+        return message
+
+    def as_bytes(self, wire_format: WireFormat = WireFormat.JSON) -> bytes:
+        return wire_format.dumps(self.as_dict())
 
     def get_interval_type(self, client: "Client") -> Optional[IntervalTypeRef]:
         return self.interval_type
@@ -139,6 +188,24 @@ class ClientEvent(Event):
 
         return ClientEventMode.DISPATCH
 
+    def get_dispatch_mode(self, client: "Client") -> ClientEventMode:
+        """
+        Like get_client_mode(), but cancels deferred events that have nothing
+        left to send, as another event already sent the data since from_state().
+        """
+        deferred = self._state is not None
+
+        if deferred and not self.has_changes(self._state):
+            return ClientEventMode.CANCEL
+
+        mode = self.get_client_mode(client)
+
+        # Build the deferred data now, as the event is about to be sent.
+        if mode == ClientEventMode.DISPATCH and deferred and self.data is None:
+            return ClientEventMode.CANCEL
+
+        return mode
+
     def on_sent(self) -> None:
         while len(self._on_sent_hooks) > 0:
             self._on_sent_hooks.pop()()
@@ -148,7 +215,7 @@ class ClientEvent(Event):
         if cls is ClientEvent:
             return ClientEvent.__name__
 
-        return cls.event_type.value
+        return cls._event_name
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], **kwargs) -> "ClientEvent":
@@ -156,102 +223,214 @@ class ClientEvent(Event):
 
     @classmethod
     def from_state(cls, state: "PrinterState", **kwargs) -> "ClientEvent":
-        return cls(cls.build(state), **kwargs)
+        event = cls(**kwargs)
+        has_changes = cls.has_changes(state)
+
+        if has_changes is None:
+            data = cls.build_data(state, event._on_sent_hooks)
+
+            if data is not None and len(data) == 0:
+                raise ValueError("Data built from state cannot be empty.")
+
+            event.data = data
+            return event
+
+        if not has_changes:
+            raise ValueError("Data built from state cannot be empty.")
+
+        # Defer building the data until the event is actually dispatched,
+        # so we do not build payloads for rate limited or cancelled events.
+        event._state = state
+        return event
+
+    @classmethod
+    def has_changes(cls, state: "PrinterState") -> Optional[bool]:
+        """
+        Cheap check if build_data() would produce any data.
+
+        Returns None if this cannot be known upfront, in which case the data
+        is built immediately by from_state() instead of when it is dispatched.
+        """
+        return None
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        ...
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        """
+        Build the event data directly from state, appending any on-sent callbacks to hooks.
+
+        Returns None for events that do not carry any state data. By default,
+        this falls back to consuming the generator returned by build().
+        """
+        generator = cls.build(state)
+
+        if generator is None:
+            return None
+
+        data = {}
+
+        for key, value, callback in generator:
+            data[key] = value
+
+            if callback is not None:
+                hooks.append(callback)
+
+        return data
+
+    @classmethod
+    def build(cls, state: "PrinterState") -> Optional[_TDataGenerator]:
+        """
+        Generator based alternative to build_data().
+
+        By default, this yields the data built by build_data(), so
+        cls(cls.build(state)) keeps working for events implementing build_data().
+        """
+        if cls.build_data.__func__ is ClientEvent.build_data.__func__:
+            return None
+
+        hooks = []
+        data = cls.build_data(state, hooks)
+
+        if data is None:
+            return None
+
+        return _iter_data(data, hooks)
 
 
 class GcodeScriptsEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.GCODE_SCRIPTS
 
 
 class MachineDataEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.INFO
+    compress = True
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        for key, value in state.info.trait_values().items():
-            yield key, value, state.info.partial_clear(key)
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        data = state.info.trait_values()
+        hooks.append(state.info.partial_clear(*data.keys()))
+        return data
 
 
 class WebcamStatusEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.WEBCAM_STATUS
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        yield "connected", state.webcam_info.connected, state.webcam_info.partial_clear("connected")
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        hooks.append(state.webcam_info.partial_clear("connected"))
+        return {"connected": state.webcam_info.connected}
 
 
 class WebcamEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.WEBCAM
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        for key, value in state.webcam_settings.trait_values().items():
-            if state.webcam_settings.has_changed(key):
-                yield key, value, state.webcam_settings.partial_clear(key)
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        data = state.webcam_settings.get_changed_values()
+
+        if data:
+            hooks.append(state.webcam_settings.partial_clear(*data.keys()))
+
+        return data
 
 
 class InstalledPluginsEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.INSTALLED_PLUGINS
+    compress = True
 
 
 class SoftwareUpdatesEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.SOFTWARE_UPDATES
+    compress = True
 
 
 class FirmwareEvent(ClientEvent):
-    event_type = PrinterEvent.FIRMWARE
+    __slots__ = ()
 
-    @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        fw = {}
+    event_type = PrinterEvent.FIRMWARE
+    compress = True
 
-        for key, value in state.firmware.trait_values().items():
-            if value is None:
-                continue
+    # PrinterFirmware trait name -> wire key, mirrors the fields of PrinterFirmware.
+    _FW_RENAME: ClassVar[Dict[str, str]] = {
+        "name": "firmware",
+        **{key: f"firmware_{key}" for key in ("name_raw", "machine", "machine_name", "version", "date", "link")},
+    }
 
-            field = f"firmware_{key}" if key != "name" else "firmware"
+    @classmethod
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        firmware = state.firmware
 
-            fw[field] = value
+        # Always send the full firmware, not just the changed fields.
+        fw = {field: value for key, field in cls._FW_RENAME.items() if (value := getattr(firmware, key)) is not None}
 
-        yield "fw", fw, state.firmware.partial_clear()
+        hooks.append(firmware.partial_clear())
+        return {"fw": fw}
 
 
 class FirmwareWarningEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.FIRMWARE_WARNING
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        for key, value in state.firmware.trait_values().items():
-            yield key, value, state.firmware.partial_clear(key)
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        data = state.firmware.trait_values()
+        hooks.append(state.firmware.partial_clear(*data.keys()))
+        return data
 
 
 class ToolEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.TOOL
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
         if not state.has_changed("active_tool"):
-            return
+            return {}
 
-        yield "new", state.active_tool, state.partial_clear("active_tool")
+        hooks.append(state.partial_clear("active_tool"))
+        return {"new": state.active_tool}
 
 
 class TemperatureEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.TEMPERATURES
     interval_type = IntervalTypes.TEMPS
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        if state.bed_temperature.has_changed():
-            yield "bed", state.bed_temperature.to_list(), state.bed_temperature.partial_clear()
+    def has_changes(cls, state: "PrinterState") -> Optional[bool]:
+        return state.bed_temperature.has_changed() or any(tool.has_changed() for tool in state.tool_temperatures)
+
+    @classmethod
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        data = {}
+        bed = state.bed_temperature
+
+        if bed.has_changed():
+            data["bed"] = bed.to_list()
+            hooks.append(bed.partial_clear())
 
         for i, tool in enumerate(state.tool_temperatures):
-            if tool.has_changed():
-                yield f"tool{i}", tool.to_list(), tool.partial_clear()
+            if not tool.has_changed():
+                continue
+
+            data[f"tool{i}"] = tool.to_list()
+            hooks.append(tool.partial_clear())
+
+        return data
 
     def get_interval_type(self, client: "Client") -> Optional[IntervalTypeRef]:
         state = client.printer
@@ -273,36 +452,47 @@ class TemperatureEvent(ClientEvent):
 
 
 class AmbientTemperatureEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.AMBIENT
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        yield "new", round(state.ambient_temperature.ambient), state.ambient_temperature.partial_clear()
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        hooks.append(state.ambient_temperature.partial_clear())
+        return {"new": round(state.ambient_temperature.ambient)}
 
 
 class ConnectionEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.CONNECTION
 
 
 class StateChangeEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.STATUS
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
         # Status has yet to be decided.
         if state.status is None:
-            return
+            return {}
 
-        yield "new", state.status.value, state.partial_clear("status")
+        hooks.append(state.partial_clear("status"))
+        return {"new": state.status.value}
 
 
 class JobInfoEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.JOB_INFO
     interval_type = IntervalTypes.JOB
     state_fields = ["started", "finished", "cancelled", "failed"]
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        data = {}
 
         if state.job_info.has_changed(*cls.state_fields):
             # Only send updates in terms of true, since they
@@ -310,23 +500,26 @@ class JobInfoEvent(ClientEvent):
             for field in cls.state_fields:
                 # Find the first True value and send it.
                 if value := getattr(state.job_info, field):
-                    yield field, value, state.job_info.partial_clear(*cls.state_fields)
+                    data[field] = value
+                    hooks.append(state.job_info.partial_clear(*cls.state_fields))
                     break
 
-        for key, value in state.job_info.trait_values().items():
+        for key, value in state.job_info.get_changed_values().items():
             # Ignore state fields
             if key in cls.state_fields:
                 continue
 
-            if state.job_info.has_changed(key):
-                if value is None:
-                    state.job_info.clear((key, None))
-                    continue
+            if value is None:
+                state.job_info.clear((key, None))
+                continue
 
-                if key == "progress":
-                    value = round(value)
+            if key == "progress":
+                value = round(value)
 
-                yield key, value, state.job_info.partial_clear(key)
+            data[key] = value
+            hooks.append(state.job_info.partial_clear(key))
+
+        return data
 
     def get_client_mode(self, client: "Client") -> ClientEventMode:
         # ALWAYS send job_info state field changes.
@@ -338,48 +531,63 @@ class JobInfoEvent(ClientEvent):
 
 # TODO in the future
 class AiResponseEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.AI_RESP
 
 
 class PrinterErrorEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.PRINTER_ERROR
 
 
 class ShutdownEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.SHUTDOWN
 
 
 class StreamEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.STREAM
     interval_type = IntervalTypes.WEBCAM
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
         # Stream events are not generated by the state, but are constructed
         # manually.
         raise NotImplementedError()
 
 
 class PingEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.PING
     interval_type = IntervalTypes.PING
 
 
 class LatencyEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.LATENCY
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        yield "ms", (state.latency.pong - state.latency.ping) * 1000, state.latency.partial_clear("ping", "pong")
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        hooks.append(state.latency.partial_clear("ping", "pong"))
+        return {"ms": (state.latency.pong - state.latency.ping) * 1000}
 
 
 class FileProgressEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.FILE_PROGRESS
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
         """
-        When a file progress event is triggered, always yield state, the two other fields 
+        When a file progress event is triggered, always send state, the two other fields
         percent and message are optionally tied to respectfully downloading and error states.
 
         But since we always send the state you can update any other fields you want to send and still 
@@ -391,65 +599,95 @@ class FileProgressEvent(ClientEvent):
         from simplyprint_ws_client.client.state import FileProgressState
 
         if state.file_progress.state is None:
-            return
+            return {}
 
-        yield "state", state.file_progress.state.value, state.file_progress.partial_clear("state")
+        data = {"state": state.file_progress.state.value}
+        hooks.append(state.file_progress.partial_clear("state"))
 
         if state.file_progress.state.value == FileProgressState.ERROR.value:
-            yield "message", state.file_progress.message or "Unknown error", state.file_progress.partial_clear(
-                "message")
+            data["message"] = state.file_progress.message or "Unknown error"
+            hooks.append(state.file_progress.partial_clear("message"))
 
-            return
+            return data
 
         # Only send percent as a field if we are downloading.
         if state.file_progress.state.value == FileProgressState.DOWNLOADING.value:
-            yield "percent", state.file_progress.percent, state.file_progress.partial_clear("percent")
+            data["percent"] = state.file_progress.percent
+            hooks.append(state.file_progress.partial_clear("percent"))
+
+        return data
 
 
 class FilamentSensorEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.FILAMENT_SENSOR
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        yield "state", state.filament_sensor.state, state.filament_sensor.partial_clear()
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        hooks.append(state.filament_sensor.partial_clear())
+        return {"state": state.filament_sensor.state}
 
 
 class PowerControllerEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.PSU
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        yield "on", state.psu_info.on, state.psu_info.partial_clear()
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        hooks.append(state.psu_info.partial_clear())
+        return {"on": state.psu_info.on}
 
 
 class CpuInfoEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.CPU_INFO
     interval_type = IntervalTypes.CPU
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        for key, value in vars(state.cpu_info).get("_trait_values", dict()).items():
-            if state.cpu_info.has_changed(key):
-                yield key, value, state.cpu_info.partial_clear(key)
+    def has_changes(cls, state: "PrinterState") -> Optional[bool]:
+        return any(state.cpu_info.trait_has_value(key) for key in state.cpu_info.get_changed())
+
+    @classmethod
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        # Only send fields that have been explicitly set.
+        data = {key: getattr(state.cpu_info, key) for key in state.cpu_info.get_changed() if
+                state.cpu_info.trait_has_value(key)}
+
+        if data:
+            hooks.append(state.cpu_info.partial_clear(*data.keys()))
+
+        return data
 
 
 class MeshDataEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.MESH_DATA
 
 
 class LogsSentEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.LOGS_SENT
 
 
 class MaterialDataEvent(ClientEvent):
+    __slots__ = ()
+
     event_type = PrinterEvent.MATERIAL_DATA
-    has_changes = False
 
     @classmethod
-    def build(cls, state: "PrinterState") -> _TDataGenerator:
-        if len(state.material_data) == 0:
-            return
+    def has_changes(cls, state: "PrinterState") -> Optional[bool]:
+        return any(material.has_changed() for material in state.material_data)
+
+    @classmethod
+    def build_data(cls, state: "PrinterState", hooks: List[Callable]) -> Optional[Dict[str, Any]]:
+        if not cls.has_changes(state):
+            return {}
 
-        if any([material.has_changed() for material in state.material_data]):
-            yield "materials", [material.trait_values() if material.type is not None else None for material in
-                                state.material_data], state.partial_clear("material_data")
+        hooks.append(state.partial_clear("material_data"))
+        return {"materials": [material.trait_values() if material.type is not None else None for material in
+                              state.material_data]}
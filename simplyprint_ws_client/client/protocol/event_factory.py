@@ -1,22 +1,37 @@
-from typing import Dict, Union, Type, Optional
+from typing import Dict, Type, Optional, Tuple
 
 from .demand_events import DemandEvent
 from .server_events import ServerEvent
 
 
 class EventFactory:
-    # Construct hashmap of events (sub-hashmap for demands)
-    _events: Dict[str, Union[Type[ServerEvent], Dict[str, Type[DemandEvent]]]] = {event.get_name(): event for event in
-                                                                                  ServerEvent.__subclasses__() if
-                                                                                  event.get_name() != DemandEvent}
-    _events[DemandEvent]: Dict[str, Type[DemandEvent]] = {event.demand: event for event in DemandEvent.__subclasses__()}
+    # Construct flat hashmap of events keyed by (name, demand), demand is None for non-demand events.
+    _events: Dict[Tuple[str, Optional[str]], Type[ServerEvent]] = {
+        **{(event.get_name(), None): event for event in ServerEvent.__subclasses__() if event is not DemandEvent},
+        **{(DemandEvent.event_type, event.demand): event for event in DemandEvent.__subclasses__()},
+    }
 
     @classmethod
-    def get_event(cls, name: str, demand: Optional[str] = None, data=None) -> ServerEvent:
+    def try_get_event(cls, name: str, demand: Optional[str] = None, data=None) -> Optional[ServerEvent]:
+        """Returns None for unknown events instead of raising."""
+        event = cls._events.get((name, demand))
+
+        if event is None:
+            return None
+
         if data is None:
             data = {}
 
         if demand is None:
-            return cls._events[name](name, data)
+            return event(name, data)
         else:
-            return cls._events[DemandEvent][demand](name, demand, data)
+            return event(name, demand, data)
+
+    @classmethod
+    def get_event(cls, name: str, demand: Optional[str] = None, data=None) -> ServerEvent:
+        event = cls.try_get_event(name, demand, data)
+
+        if event is None:
+            raise KeyError(demand if demand is not None else name)
+
+        return event
@@ -0,0 +1,68 @@
+import datetime
+from enum import Enum
+from typing import Any, List, Union
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode the types orjson supports natively, but msgpack does not."""
+    if isinstance(obj, Enum):
+        return obj.value
+
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+
+    raise TypeError(f"Type is not msgpack serializable: {type(obj).__name__}")
+
+
+class WireFormat(Enum):
+    """
+    Serialization used for websocket frames.
+
+    JSON is always available, MSGPACK requires the optional msgpack dependency
+    and has to be negotiated with the server when connecting.
+    """
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    def is_available(self) -> bool:
+        return self is not WireFormat.MSGPACK or msgpack is not None
+
+    def dumps(self, obj: Any) -> bytes:
+        if self is WireFormat.MSGPACK:
+            assert msgpack is not None, "msgpack is not installed"
+            return msgpack.packb(obj, default=_msgpack_default)
+
+        # Like json.dumps, convert non-str dict keys instead of raising.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Raises ValueError on invalid data. Text frames are always JSON."""
+        if self is WireFormat.MSGPACK and not isinstance(data, str):
+            assert msgpack is not None, "msgpack is not installed"
+            return msgpack.unpackb(data)
+
+        return orjson.loads(data)
+
+    def join(self, payloads: List[bytes]) -> bytes:
+        """Combine already serialized payloads into a single serialized array."""
+        if self is WireFormat.MSGPACK:
+            assert msgpack is not None, "msgpack is not installed"
+            return b"".join([msgpack.Packer().pack_array_header(len(payloads)), *payloads])
+
+        if not payloads:
+            return b"[]"
+
+        # Interleave brackets and separators, so the frame is allocated in a single join.
+        parts = [b","] * (2 * len(payloads) + 1)
+        parts[0], parts[-1] = b"[", b"]"
+        parts[1::2] = payloads
+
+        return b"".join(parts)
@@ -60,6 +60,10 @@ class ClientState(HasTraits):
     def get_changed(self) -> List[str]:
         return list(self._changed_fields)
 
+    def get_changed_values(self) -> Dict[str, Any]:
+        """Values of changed fields only, avoids scanning every trait like trait_values()."""
+        return {field: getattr(self, field) for field in self._changed_fields}
+
     def clear(self, *fields: Tuple[str, Optional[int]]):
         if not fields:
             self._changed_fields.clear()
@@ -41,4 +41,8 @@ class Temperature(ClientState):
         return self.rounded_actual != self.rounded_target
 
     def to_list(self):
-        return [self.rounded_actual] + (([self.rounded_target]) if self.target is not _float_sentinel else [])
+        # Build the list in one go, this is called for every changed tool on each temperature event.
+        if self.target is _float_sentinel:
+            return [self.rounded_actual]
+
+        return [self.rounded_actual, self.rounded_target]
@@ -1,10 +1,9 @@
 import asyncio
-import json
 import logging
 import time
 from asyncio import CancelledError
 from contextlib import suppress
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from aiohttp import (ClientSession,
                      ClientWebSocketResponse, WSMsgType,
@@ -12,7 +11,7 @@ from aiohttp import (ClientSession,
 from yarl import URL
 
 from ..client.client import Client
-from ..client.protocol import DemandEvent, ServerEvent, EventFactory
+from ..client.protocol import DemandEvent, ServerEvent, EventFactory, WireFormat
 from ..client.protocol.client_events import ClientEvent, ClientEventMode, PingEvent
 from ..client.protocol.server_events import PongEvent
 from ..events.event import Event
@@ -25,27 +24,34 @@ from ..utils.traceability import traceable
 
 
 class ConnectionPollEvent(Event):
+    __slots__ = ("event", "for_client", "allow_backlog")
+
     event: Union[ServerEvent, DemandEvent]
-    for_client: Optional[Union[str, int]] = None
+    for_client: Optional[Union[str, int]]
 
     # Some events should be ignored not backlogged.
     # TODO clean this up.
-    allow_backlog: bool = True
+    allow_backlog: bool
 
     def __init__(self, event: Union[ServerEvent, DemandEvent], for_client: Optional[Union[str, int]] = None) -> None:
         self.event = event
         self.for_client = for_client
+        self.allow_backlog = True
 
 
 class ConnectionConnectedEvent(Event):
-    reconnect: bool = False
+    __slots__ = ("reconnect",)
+
+    reconnect: bool
 
     def __init__(self, reconnect: bool = False) -> None:
         self.reconnect = reconnect
 
 
 class ConnectionDisconnectEvent(Event):
-    ignore_connection_criteria: bool = False
+    __slots__ = ("ignore_connection_criteria",)
+
+    ignore_connection_criteria: bool
 
     def __init__(self, ignore_connection_criteria: bool = False) -> None:
         self.ignore_connection_criteria = ignore_connection_criteria
@@ -53,6 +59,13 @@ class ConnectionDisconnectEvent(Event):
 
 ConnectionEventBus = EventBus[Event]
 
+_WS_CLOSE_TYPES = frozenset((WSMsgType.CLOSED, WSMsgType.CLOSING, WSMsgType.CLOSE))
+
+
+def _json_dumps(obj: Any) -> str:
+    """aiohttp expects a str returning serializer, orjson returns bytes."""
+    return WireFormat.JSON.dumps(obj).decode("utf-8")
+
 
 class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
     logger = logging.getLogger("websocket")
@@ -78,6 +91,26 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
     timeout: float = 5.0
     debug: bool = True
 
+    # Preferred serialization of frames, anything but JSON is requested as websocket subprotocol.
+    preferred_wire_format: WireFormat = WireFormat.JSON
+
+    # Serialization of frames on the current connection, only differs from JSON
+    # when the server confirmed the preferred wire format by selecting its subprotocol.
+    wire_format: WireFormat = WireFormat.JSON
+
+    # Negotiate permessage-deflate, only events with compress set are sent compressed.
+    compress_events: bool = False
+
+    # Coalesce multiple events into a single JSON array frame in send_events.
+    # Requires server support, so it is disabled by default.
+    batch_events: bool = False
+
+    # Received events are dispatched from a separate task so the next frame can be
+    # received while listeners run. Once the queue is full, polling waits for it.
+    poll_queue_size: int = 64
+    _poll_queue: Optional[asyncio.Queue] = None
+    _poll_consumer: Optional[asyncio.Task] = None
+
     def __init__(self, event_loop_provider: Optional[EventLoopProvider] = None) -> None:
         super().__init__(provider=event_loop_provider)
         self.event_bus = ConnectionEventBus(event_loop_provider=self)
@@ -101,14 +134,15 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
         if self.last_received_pong >= self.last_sent_ping:
             return True
 
-        time_since_last_ping = time.time() - self.last_sent_ping
+        now = time.time()
+        time_since_last_ping = now - self.last_sent_ping
 
         # If we JUST sent a ping inside a timeframe of 1 second, we are still waiting for a pong.
         # So there is no need to consider the connection non-responsive. This prevents unnecessary log spam.                                                
         if time_since_last_ping < 1:
             return True
 
-        time_since_last_received = time.time() - self.last_received_at
+        time_since_last_received = now - self.last_received_at
 
         # If we are missing a pong we consider the connection non-responsive after 6x the ping interval
         # since the last received event (could be anything) which is typically 2 minutes.
@@ -121,7 +155,7 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
             return False
 
         # Output a debug message if the connection is potentially unresponsive.
-        if self.debug and time_since_last_received > 1:
+        if self.debug and time_since_last_received > 1 and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 f"Connection is potentially unresponsive! Has not received any events for {time_since_last_received} seconds."
                 f" {self.last_received_pong=} {self.last_sent_ping=} {self.last_received_at=}"
@@ -141,13 +175,16 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
                     self.logger.warning("Already connected, not reconnecting as reconnects are not allowed.")
                     return
 
-                if self.ws or self.session:
-                    await self.force_close()
-                    self.ws = self.session = None
+                if self.ws:
+                    # Keep the session (connection pool, DNS cache) around for the reconnect.
+                    await self.force_close(close_session=False)
+                    self.ws = None
 
                 self.url = url or self.url
                 self.timeout = timeout or self.timeout
-                self.session = ClientSession()
+
+                if self.session is None or self.session.closed:
+                    self.session = ClientSession(json_serialize=_json_dumps)
 
                 if not self.url:
                     raise ValueError("No URL specified")
@@ -156,18 +193,27 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
                     f"{'Connecting' if not reconnection else 'Reconnecting'} to {self.url}")
 
                 ws = None
+                wire_format = self.preferred_wire_format
+
+                if not wire_format.is_available():
+                    self.logger.warning(f"Wire format {wire_format.value} is not available, using JSON.")
+                    wire_format = WireFormat.JSON
 
                 try:
                     ws = await self.session.ws_connect(
                         str(self.url),
+                        protocols=() if wire_format is WireFormat.JSON else (wire_format.value,),
                         timeout=timeout,
                         autoclose=True,
                         autoping=True,
                         heartbeat=10,
                         max_msg_size=0,
-                        compress=False,
+                        compress=15 if self.compress_events else 0,
                     )
 
+                    if ws.compress:
+                        self._disable_default_compression(ws)
+
                 except ClientResponseError as e:
                     self.logger.info(f"Failed to connect to {self.url} with status code {repr(e)}")
                 except (ConnectionRefusedError, ClientError) as e:
@@ -186,6 +232,11 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
                         ConnectionDisconnectEvent(ignore_connection_criteria=ignore_connection_criteria))
                     return
 
+                if wire_format is not WireFormat.JSON and ws.protocol != wire_format.value:
+                    self.logger.warning(f"Server did not accept wire format {wire_format.value}, using JSON.")
+                    wire_format = WireFormat.JSON
+
+                self.wire_format = wire_format
                 self.ws = ws
 
                 # SAFETY: Only one of these are emitted on connect
@@ -193,13 +244,17 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
 
                 self.logger.debug(f"Connected to {self.url} {reconnection=}")
 
-    async def force_close(self):
+    async def force_close(self, close_session=True):
+        """Close the websocket, and unless it is reused for reconnecting, the session."""
         try:
             if self.ws:
                 await self.ws.close()
         except Exception as e:
             self.logger.error("An exception occurred while closing to handle a disconnect condition", exc_info=e)
 
+        if not close_session:
+            return
+
         try:
             if self.session:
                 await self.session.close()
@@ -218,8 +273,10 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
         closed = self.ws.closed if self.ws else False
         close_code = self.ws.close_code if self.ws else None
 
-        if self.is_connected():
-            await self.force_close()
+        # is_connected() only inspects state, so tear down here any socket that is
+        # still open but unresponsive, otherwise connect() treats it as connected.
+        if self.is_open():
+            await self.force_close(close_session=False)
 
         if not reason:
             reason = "Unknown"
@@ -238,87 +295,181 @@ class Connection(EventLoopProvider[asyncio.AbstractEventLoop]):
             return
 
         try:
-            mode = event.get_client_mode(client)
+            mode = event.get_dispatch_mode(client)
 
             if mode != ClientEventMode.DISPATCH:
                 # This log is too verbose.
                 # self.logger.debug(f"Did not send event {event.get_name()} because of mode {mode.name}")
                 return
 
-            message = event.as_dict()
+            payload = event.as_bytes(self.wire_format)
 
-            await self.ws.send_json(message)
+            await self._send_payload(payload, compress=self._event_compress(event))
 
             event.on_sent()
 
             if isinstance(event, PingEvent):
                 self.last_sent_ping = time.time()
 
-            if self.debug:
-                self.logger.debug(f"Sent event {event.get_name()}" if len(
-                    str(message)) > 1000 else f"Sent event {event} with data {message}")
+            if self.debug and self.logger.isEnabledFor(logging.DEBUG):
+                if len(payload) > 1000:
+                    self.logger.debug("Sent event %s", event.get_name())
+                else:
+                    self.logger.debug("Sent event %s with data %s", event, event.as_dict())
 
         except ConnectionResetError as e:
             await self.on_disconnect(f"Failed to send event {event}")
             self.logger.exception(e)
 
+    async def send_events(self, client: Client, events: List[ClientEvent]) -> None:
+        """Send multiple events at once, as a single frame if batching is enabled."""
+        if not events:
+            return
+
+        if not self.batch_events:
+            for event in events:
+                await self.send_event(client, event)
+
+            return
+
+        if not self.is_connected():
+            await self.on_disconnect(f"Did not send {len(events)} events because not connected")
+            return
+
+        try:
+            events = [event for event in events if event.get_dispatch_mode(client) == ClientEventMode.DISPATCH]
+
+            if not events:
+                return
+
+            await self._send_payload(self.wire_format.join([event.as_bytes(self.wire_format) for event in events]),
+                                     compress=max(self._event_compress(event) or 0 for event in events) or None)
+
+            for event in events:
+                event.on_sent()
+
+                if isinstance(event, PingEvent):
+                    self.last_sent_ping = time.time()
+
+            if self.debug:
+                self.logger.debug("Sent %d events in a single frame", len(events))
+
+        except ConnectionResetError as e:
+            await self.on_disconnect(f"Failed to send {len(events)} events")
+            self.logger.exception(e)
+
+    async def _send_payload(self, payload: bytes, compress: Optional[int] = None) -> None:
+        """JSON is sent as text frames as the server expects, other wire formats as binary frames."""
+        if self.wire_format is WireFormat.JSON:
+            await self.ws.send_str(payload.decode("utf-8"), compress=compress)
+            return
+
+        await self.ws.send_bytes(payload, compress=compress)
+
+    def _disable_default_compression(self, ws: ClientWebSocketResponse) -> None:
+        """
+        aiohttp compresses every frame once negotiated, but RFC 7692 allows
+        uncompressed messages, so only compress per frame (see _event_compress).
+
+        There is no public API for this, so if the writer does not have the expected
+        attribute, every frame stays compressed which is valid but costs CPU.
+        """
+        writer = getattr(ws, "_writer", None)
+
+        if not isinstance(getattr(writer, "compress", None), int):
+            self.logger.debug("Unable to disable the default compression, compressing every frame.")
+            return
+
+        writer.compress = 0
+
+    def _event_compress(self, event: ClientEvent) -> Optional[int]:
+        """Per frame compression level, if the event should and can be compressed."""
+        if not event.compress or not self.ws.compress:
+            return None
+
+        return self.ws.compress
+
     @traceable
     async def poll_event(self, timeout=None) -> None:
         if not self.is_connected():
             await self.on_disconnect(f"Did not poll event because not connected")
             return
 
+        # Bind hot attributes locally, this runs for every received frame.
+        ws = self.ws
+        logger = self.logger
+
         try:
-            message = await self.ws.receive(timeout=timeout)
+            message = await ws.receive(timeout=timeout)
+            message_type = message.type
+            message_data = message.data
 
             self.last_received_at = time.time()
 
-            if message.type in (WSMsgType.CLOSED, WSMsgType.CLOSING, WSMsgType.CLOSE):
-                self.logger.debug(
-                    f"Websocket closed by server with code: {self.ws.close_code}. {message.data=} {message.extra=}")
+            if message_type in _WS_CLOSE_TYPES:
+                logger.debug(
+                    f"Websocket closed by server with code: {ws.close_code}. {message.data=} {message.extra=}")
 
                 # An exception can be passed via the message.data
-                if isinstance(message.data, Exception):
-                    self.logger.exception(message.data)
+                if isinstance(message_data, Exception):
+                    logger.exception(message_data)
 
                 await self.on_disconnect("Websocket closed by server.")
                 return
 
-            if message.type == WSMsgType.ERROR:
-                await self.on_disconnect(f"Websocket error: {message.data}")
+            if message_type is WSMsgType.ERROR:
+                await self.on_disconnect(f"Websocket error: {message_data}")
                 return
 
-            if message.type == WSMsgType.BINARY:
-                message.data = message.data.decode("utf-8")
-
             try:
-                event: Dict[str, Any] = json.loads(message.data)
-            except json.JSONDecodeError:
-                self.logger.error(f"Failed to parse event: {message.data}")
+                # Accepts both bytes (BINARY) and str (TEXT) payloads.
+                event: Dict[str, Any] = self.wire_format.loads(message_data)
+            except ValueError:
+                logger.error(f"Failed to parse event: {message_data}")
                 return
 
-            name: str = event.get("type", "")
-            data: Dict[str, Any] = event.get("data", {})
-            for_client: Optional[Union[str, int]] = event.get("for")
+            get = event.get
+            name: str = get("type", "")
+            data: Dict[str, Any] = get("data") or {}
+            for_client: Optional[Union[str, int]] = get("for")
             demand: Optional[str] = data.get("demand")
 
-            try:
-                event: ServerEvent = EventFactory.get_event(name, demand, data)
-            except KeyError as e:
-                self.logger.error(f"Unknown event type {e.args[0]}")
+            event: Optional[ServerEvent] = EventFactory.try_get_event(name, demand, data)
+
+            if event is None:
+                logger.error(f"Unknown event type {name} {demand=}")
                 return
 
             if isinstance(event, PongEvent):
                 self.last_received_pong = self.last_received_at
 
             if self.debug:
-                self.logger.debug(
-                    f"Received event {event.get_name()} with data {message.data} for client {for_client}")
+                logger.debug("Received event %s with data %s for client %s", event.get_name(), message_data, for_client)
 
-            await self.event_bus.emit(ConnectionPollEvent(event, for_client))
+            await self._dispatch_poll_event(ConnectionPollEvent(event, for_client))
 
         except (CancelledError, TimeoutError, ConnectionResetError):
             await self.on_disconnect(f"Websocket closed by server due to timeout.")
 
         except Exception as e:
-            self.logger.exception(f"Exception occurred when polling event", exc_info=e)
+            logger.exception(f"Exception occurred when polling event", exc_info=e)
+
+    async def _dispatch_poll_event(self, event: ConnectionPollEvent) -> None:
+        if self._poll_queue is None:
+            self._poll_queue = asyncio.Queue(maxsize=self.poll_queue_size)
+
+        await self._poll_queue.put(event)
+
+        # SAFETY: The consumer exits once the queue is drained, so it is restarted on demand.
+        if self._poll_consumer is None or self._poll_consumer.done():
+            self._poll_consumer = self.event_loop.create_task(self._consume_poll_events())
+
+    async def _consume_poll_events(self) -> None:
+        """Emit queued poll events in the order they were received."""
+        while not self._poll_queue.empty():
+            event = self._poll_queue.get_nowait()
+
+            try:
+                await self.event_bus.emit(event)
+            except Exception as e:
+                self.logger.exception(f"Exception occurred when dispatching event {event.event}", exc_info=e)
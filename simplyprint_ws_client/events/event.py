@@ -4,6 +4,8 @@ from .event_bus_listeners import ListenerUniqueness, ListenerLifetime, ListenerL
 
 
 class EventTraits:
+    __slots__ = ()
+
     def __eq__(self: Union[Type['Event'], 'Event'], other: object) -> bool:
         if isinstance(other, str):
             return self.get_name() == other
@@ -31,7 +33,9 @@ class Event(EventTraits, metaclass=EventType):
     Base event class for type-hinting, not required to be used.
     """
 
-    __stopped: bool = False
+    __slots__ = ("__stopped",)
+
+    __stopped: bool
 
     @classmethod
     def get_name(cls) -> str:
@@ -39,7 +43,10 @@ class Event(EventTraits, metaclass=EventType):
 
     # Allow for propagation control of events.
     def is_stopped(self) -> bool:
-        return self.__stopped
+        try:
+            return self.__stopped
+        except AttributeError:
+            return False
 
     def stop_event(self) -> None:
         self.__stopped = True
@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import functools
 from asyncio import AbstractEventLoop
 from itertools import chain
@@ -161,24 +162,37 @@ class EventBus(Emitter[TEvent]):
         if not isinstance(self.event_klass, type):
             self.event_klass = Event
 
+    def has_listeners(self, event: Union[Hashable, TEvent]) -> bool:
+        """Whether emitting the event would invoke anything, including middleware."""
+        return len(self.middleware) > 0 or bool(self.listeners.get(event))
+
     async def emit(self, event: Union[Hashable, TEvent], *args, **kwargs) -> None:
-        if event not in self.listeners and len(self.middleware) == 0:
+        listeners = self.listeners.get(event)
+
+        if not listeners and len(self.middleware) == 0:
             return
 
-        generator = _EmitGenerator(self, chain(self.middleware, self.listeners.get(event, [])), event, args, kwargs)
+        generator = _EmitGenerator(self, chain(self.middleware, listeners or []), event, args, kwargs)
 
         for listener, nargs, nkwargs in generator:
-            ret = await listener(*nargs, **nkwargs)
+            # Call synchronous handlers directly instead of through a coroutine.
+            if listener.is_async:
+                ret = await listener.handler(*nargs, **nkwargs)
+            else:
+                ret = listener.handler(*nargs, **nkwargs)
+
             generator.update(ret)
 
     def emit_sync(self, event: Union[Hashable, TEvent], *args, **kwargs) -> None:
-        if event not in self.listeners and len(self.middleware) == 0:
+        listeners = self.listeners.get(event)
+
+        if not listeners and len(self.middleware) == 0:
             return
 
         # Only invoke non-async functions.
         generator = _EmitGenerator(
             self,
-            chain(self.middleware, filter(lambda lst: not lst.is_async, self.listeners.get(event, []))),
+            chain(self.middleware, filter(lambda lst: not lst.is_async, listeners or [])),
             event,
             args, kwargs)
 
@@ -186,8 +200,14 @@ class EventBus(Emitter[TEvent]):
             ret = listener.handler(*nargs, **nkwargs)
             generator.update(ret)
 
-    def emit_task(self, event: Union[Hashable, TEvent], *args, **kwargs) -> asyncio.Future:
+    def emit_task(self, event: Union[Hashable, TEvent], *args, **kwargs) -> concurrent.futures.Future:
         """Allows for synchronous emitting of events. Useful cross-thread communication."""
+        if not self.has_listeners(event):
+            # Nothing to run, so skip scheduling a coroutine on the loop.
+            future = concurrent.futures.Future()
+            future.set_result(None)
+            return future
+
         return asyncio.run_coroutine_threadsafe(
             self.emit(event, *args, **kwargs), self.event_loop_provider.event_loop)
 
@@ -0,0 +1,188 @@
+import unittest
+
+import orjson
+
+from simplyprint_ws_client.client.protocol import client_events
+from simplyprint_ws_client.client.protocol.client_events import (ClientEvent, ConnectionEvent, CpuInfoEvent,
+                                                                 FirmwareEvent, JobInfoEvent, MeshDataEvent, PingEvent,
+                                                                 StateChangeEvent, TemperatureEvent)
+from simplyprint_ws_client.client.protocol.wire_format import WireFormat
+from simplyprint_ws_client.client.state import PrinterState, PrinterStatus
+from simplyprint_ws_client.client.state.printer import PrinterFilamentSensorEnum, PrinterFirmware
+
+
+class TestClientEvents(unittest.TestCase):
+    def test_get_name(self):
+        self.assertEqual(ClientEvent.get_name(), "ClientEvent")
+        self.assertEqual(PingEvent.get_name(), "ping")
+        self.assertEqual(TemperatureEvent.get_name(), "temps")
+
+    def test_as_bytes(self):
+        event = PingEvent(for_client="abc")
+
+        payload = event.as_bytes()
+
+        self.assertEqual(orjson.loads(payload), {"type": "ping", "for": "abc"})
+
+        event.for_client = None
+
+        self.assertEqual(orjson.loads(event.as_bytes()), {"type": "ping"})
+
+        # The payload always reflects the current data.
+        mesh_event = MeshDataEvent({"a": 1})
+        mesh_event.as_bytes()
+        mesh_event.data = {"b": 2}
+
+        self.assertEqual(orjson.loads(mesh_event.as_bytes()), {"type": "mesh_data", "data": {"b": 2}})
+
+        self.assertEqual(WireFormat.JSON.join([]), b"[]")
+        self.assertEqual(orjson.loads(WireFormat.JSON.join([event.as_bytes(), PingEvent(for_client="abc").as_bytes()])),
+                         [{"type": "ping"}, {"type": "ping", "for": "abc"}])
+
+    def test_as_dict(self):
+        self.assertEqual(PingEvent().as_dict(), {"type": "ping"})
+        self.assertEqual(PingEvent(for_client=0).as_dict(), {"type": "ping"})
+        self.assertEqual(ClientEvent({"a": 1}, for_client=1).as_dict(),
+                         {"type": "ClientEvent", "for": 1, "data": {"a": 1}})
+
+    def test_from_state(self):
+        state = PrinterState()
+
+        # Events without state data are sent without a data field.
+        self.assertIsNone(ConnectionEvent.from_state(state).data)
+
+        # Events with state data cannot be empty.
+        self.assertRaises(ValueError, lambda: StateChangeEvent.from_state(state))
+
+        state.status = PrinterStatus.OPERATIONAL
+
+        event = StateChangeEvent.from_state(state)
+
+        self.assertEqual(event.data, {"new": "operational"})
+        self.assertTrue(state.has_changed("status"))
+
+        event.on_sent()
+
+        self.assertFalse(state.has_changed("status"))
+
+    def test_build(self):
+        state = PrinterState()
+
+        self.assertIsNone(ConnectionEvent.build(state))
+        self.assertRaises(ValueError, lambda: StateChangeEvent(StateChangeEvent.build(state)))
+
+        state.status = PrinterStatus.OPERATIONAL
+
+        event = StateChangeEvent(StateChangeEvent.build(state))
+
+        self.assertEqual(event.data, {"new": "operational"})
+
+        event.on_sent()
+
+        self.assertFalse(state.has_changed("status"))
+
+        # Events only implementing build() are built via build_data().
+        class LegacyEvent(ClientEvent):
+            @classmethod
+            def build(cls, state):
+                yield "status", state.status.value, None
+
+        self.assertEqual(LegacyEvent.from_state(state).data, {"status": "operational"})
+
+    def test_changed_values_only(self):
+        state = PrinterState()
+
+        state.cpu_info.usage = 10.0
+        state.job_info.progress = 41.6
+        state.job_info.filename = None
+
+        self.assertEqual(CpuInfoEvent.from_state(state).data, {"usage": 10.0})
+
+        event = JobInfoEvent.from_state(state)
+
+        self.assertEqual(event.data, {"progress": 42})
+
+        event.on_sent()
+
+        self.assertFalse(state.job_info.has_changed())
+        self.assertRaises(ValueError, lambda: JobInfoEvent.from_state(state))
+
+    def test_firmware(self):
+        self.assertEqual(set(FirmwareEvent._FW_RENAME), set(PrinterFirmware.class_trait_names()))
+
+        state = PrinterState()
+
+        state.firmware.name = "Klipper"
+        state.firmware.version = "v0.12"
+
+        self.assertEqual(FirmwareEvent.from_state(state).data,
+                         {"fw": {"firmware": "Klipper", "firmware_version": "v0.12"}})
+
+    def test_slots(self):
+        event = PingEvent()
+
+        self.assertFalse(hasattr(event, "__dict__"))
+        self.assertFalse(event.is_stopped())
+
+        event.stop_event()
+
+        self.assertTrue(event.is_stopped())
+
+    @unittest.skipUnless(WireFormat.MSGPACK.is_available(), "msgpack is not installed")
+    def test_msgpack_wire_format(self):
+        import msgpack
+
+        event = PingEvent(for_client="abc")
+
+        payload = event.as_bytes(WireFormat.MSGPACK)
+
+        self.assertEqual(msgpack.unpackb(payload), {"type": "ping", "for": "abc"})
+        self.assertEqual(WireFormat.MSGPACK.loads(payload), event.as_dict())
+        self.assertEqual(orjson.loads(event.as_bytes()), event.as_dict())
+
+        joined = WireFormat.MSGPACK.join([payload, PingEvent().as_bytes(WireFormat.MSGPACK)])
+
+        self.assertEqual(msgpack.unpackb(joined), [{"type": "ping", "for": "abc"}, {"type": "ping"}])
+
+        # Text frames are always JSON.
+        self.assertEqual(WireFormat.MSGPACK.loads('{"type": "pong"}'), {"type": "pong"})
+
+    @unittest.skipUnless(WireFormat.MSGPACK.is_available(), "msgpack is not installed")
+    def test_wire_formats_match(self):
+        import msgpack
+
+        state = PrinterState()
+
+        state.status = PrinterStatus.OPERATIONAL
+        state.filament_sensor.state = PrinterFilamentSensorEnum.LOADED
+        state.bed_temperature.actual = 20.0
+        state.job_info.progress = 41.6
+        state.firmware.name = "Klipper"
+        state.cpu_info.usage = 10.0
+
+        for event_cls in [value for value in vars(client_events).values() if
+                          isinstance(value, type) and issubclass(value, ClientEvent) and value is not ClientEvent]:
+            try:
+                event = event_cls.from_state(state)
+            except (ValueError, NotImplementedError):
+                event = event_cls({"custom": PrinterStatus.OPERATIONAL})
+
+            with self.subTest(event=event_cls.__name__):
+                self.assertEqual(msgpack.unpackb(event.as_bytes(WireFormat.MSGPACK)), orjson.loads(event.as_bytes()))
+
+    def test_deferred_build(self):
+        state = PrinterState()
+
+        state.bed_temperature.actual = 20.0
+
+        event = TemperatureEvent.from_state(state)
+
+        # Data is only built once accessed, so it reflects the latest state.
+        state.bed_temperature.actual = 25.0
+
+        self.assertEqual(event.as_dict(), {"type": "temps", "data": {"bed": [25]}})
+
+        event.on_sent()
+
+        self.assertFalse(state.bed_temperature.has_changed())
+        self.assertRaises(ValueError, lambda: TemperatureEvent.from_state(state))
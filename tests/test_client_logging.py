@@ -39,6 +39,28 @@ logging.basicConfig(level=logging.DEBUG, handlers=[logging.StreamHandler(stream_
 
 
 class TestClientLogging(unittest.TestCase):
+    def test_client_name(self):
+        name = ClientName(config).push("a")
+
+        self.assertEqual(str(name), "test.a")
+        self.assertEqual(hash(name), hash("test.a"))
+
+        name.push("b")
+        self.assertEqual(str(name), "test.a.b")
+        self.assertEqual(hash(name), hash("test.a.b"))
+
+        name.pop()
+        self.assertEqual(str(name), "test.a")
+        self.assertEqual(str(name.getChild("c")), "test.a.c")
+        self.assertEqual(str(name), "test.a")
+
+        # Comparisons use the composed name, consistent with the hash.
+        self.assertEqual(name, "test.a")
+        self.assertEqual(name, ClientName(config).push("a"))
+        self.assertNotEqual(name, ClientName(config))
+        self.assertNotEqual(name, "test")
+        self.assertEqual(len({name, ClientName(config).push("a")}), 1)
+
     def test_client_logging(self):
         root_logger = logging.getLogger()
 
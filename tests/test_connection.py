@@ -0,0 +1,347 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+import orjson
+from aiohttp import WSMessage, WSMsgType, web
+from aiohttp.test_utils import TestServer
+
+from simplyprint_ws_client.client.instance.single_printer import SinglePrinter
+from simplyprint_ws_client.client.protocol.client_events import (ClientEventMode, GcodeScriptsEvent,
+                                                                 InstalledPluginsEvent, LogsSentEvent, MeshDataEvent,
+                                                                 PingEvent, TemperatureEvent)
+from simplyprint_ws_client.client.protocol import WireFormat
+from simplyprint_ws_client.client.protocol.server_events import PongEvent
+from simplyprint_ws_client.client.state import PrinterState
+from simplyprint_ws_client.connection.connection import Connection, ConnectionConnectedEvent, ConnectionPollEvent
+
+
+class FakeWebSocket:
+    closed = False
+    close_code = None
+    compress = 0
+
+    def __init__(self) -> None:
+        self.frames = []
+        self.messages = []
+
+    async def receive(self, timeout=None):
+        return self.messages.pop(0)
+
+    async def send_str(self, data, compress=None):
+        self.frames.append((WSMsgType.TEXT, data, compress))
+
+    async def send_bytes(self, data, compress=None):
+        self.frames.append((WSMsgType.BINARY, data, compress))
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeWriter:
+    compress = 15
+
+
+class FakeConfig:
+    def is_pending(self):
+        return False
+
+
+class FakePrinter:
+    def mark_all_changed_dirty(self):
+        ...
+
+
+class FakeIntervals:
+    def use(self, t):
+        ...
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.config = FakeConfig()
+        self.printer = FakePrinter()
+
+
+class TestConnection(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.connection = Connection()
+        self.connection.ws = self.ws = FakeWebSocket()
+
+    async def test_send_event(self):
+        await self.connection.send_event(None, MeshDataEvent({1: "a"}))
+
+        self.assertEqual(len(self.ws.frames), 1)
+
+        frame_type, data, compress = self.ws.frames[0]
+
+        # JSON is sent as text, and non-str keys are converted like json.dumps does.
+        self.assertIs(frame_type, WSMsgType.TEXT)
+        self.assertEqual(orjson.loads(data), {"type": "mesh_data", "data": {"1": "a"}})
+        self.assertIsNone(compress)
+
+    async def test_send_events(self):
+        events = [MeshDataEvent({"a": 1}), LogsSentEvent({"b": 2}), GcodeScriptsEvent({"c": 3})]
+
+        # Without batching every event is sent as its own frame.
+        await self.connection.send_events(None, events)
+
+        self.assertEqual(len(self.ws.frames), 3)
+
+        self.ws.frames.clear()
+        self.connection.batch_events = True
+
+        await self.connection.send_events(None, events)
+
+        self.assertEqual(len(self.ws.frames), 1)
+        self.assertEqual(orjson.loads(self.ws.frames[0][1]), [event.as_dict() for event in events])
+
+    async def test_send_events_empty(self):
+        self.connection.batch_events = True
+        self.connection.ws = None
+        self.connection.on_disconnect = AsyncMock()
+
+        # Nothing to send does not count as a failed send.
+        await self.connection.send_events(None, [])
+
+        self.connection.on_disconnect.assert_not_awaited()
+
+    async def test_event_compression(self):
+        plugins = InstalledPluginsEvent({"plugins": []})
+        mesh = MeshDataEvent({"a": 1})
+
+        # Nothing is compressed unless the server negotiated compression.
+        await self.connection.send_event(None, plugins)
+
+        self.ws.compress = 15
+
+        await self.connection.send_event(None, plugins)
+        await self.connection.send_event(None, mesh)
+
+        self.assertEqual([compress for _, _, compress in self.ws.frames], [None, 15, None])
+
+        self.ws.frames.clear()
+        self.connection.batch_events = True
+
+        # Batched frames are compressed if any of the events should be.
+        await self.connection.send_events(None, [mesh, plugins])
+        await self.connection.send_events(None, [mesh, LogsSentEvent({"b": 2})])
+
+        self.assertEqual([compress for _, _, compress in self.ws.frames], [15, None])
+
+    async def test_deferred_event_already_sent(self):
+        client = FakeClient()
+        client.printer = state = PrinterState()
+        client.intervals = FakeIntervals()
+
+        state.bed_temperature.actual = 20.0
+
+        first, second = TemperatureEvent.from_state(state), TemperatureEvent.from_state(state)
+
+        await self.connection.send_event(client, second)
+
+        # The second event sent the data, so the first one has nothing left to send.
+        self.assertIs(first.get_dispatch_mode(client), ClientEventMode.CANCEL)
+
+        await self.connection.send_event(client, first)
+
+        self.assertEqual([orjson.loads(data) for _, data, _ in self.ws.frames], [{"type": "temps", "data": {"bed": [20]}}])
+
+    def test_disable_default_compression(self):
+        # Without the private writer attribute every frame stays compressed.
+        with self.assertLogs("websocket", "DEBUG"):
+            self.connection._disable_default_compression(self.ws)
+
+        self.ws._writer = FakeWriter()
+
+        self.connection._disable_default_compression(self.ws)
+
+        self.assertEqual(self.ws._writer.compress, 0)
+
+
+class TestConnectionPolling(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.connection = Connection()
+        self.connection.use_running_loop()
+        self.connection.ws = self.ws = FakeWebSocket()
+
+        self.received = []
+        self.connection.event_bus.on(ConnectionPollEvent, self.on_poll_event)
+
+    async def on_poll_event(self, event: ConnectionPollEvent):
+        # Yield while handling, so later events could overtake this one.
+        await asyncio.sleep(0)
+        self.received.append(event.event.data["n"])
+
+    async def wait_for_consumer(self):
+        await asyncio.wait_for(self.connection._poll_consumer, timeout=1)
+
+    async def test_poll_event_order(self):
+        for n in range(10):
+            self.ws.messages.append(WSMessage(WSMsgType.TEXT, orjson.dumps({"type": "pong", "data": {"n": n}}), None))
+
+        for _ in range(10):
+            await self.connection.poll_event()
+
+        await self.wait_for_consumer()
+
+        self.assertEqual(self.received, list(range(10)))
+
+    async def test_poll_event_backpressure(self):
+        self.connection.poll_queue_size = 2
+
+        release = asyncio.Event()
+
+        async def blocking_handler(event: ConnectionPollEvent):
+            await release.wait()
+
+        self.connection.event_bus.on(ConnectionPollEvent, blocking_handler, priority=10)
+
+        # The first event is taken by the consumer, the next two fill the queue.
+        for n in range(3):
+            await self.connection._dispatch_poll_event(ConnectionPollEvent(PongEvent("pong", {"n": n})))
+            await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(
+            self.connection._dispatch_poll_event(ConnectionPollEvent(PongEvent("pong", {"n": 3}))))
+
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(blocked.done())
+
+        release.set()
+
+        await asyncio.wait_for(blocked, timeout=1)
+        await self.wait_for_consumer()
+
+        self.assertEqual(self.received, list(range(4)))
+
+    async def test_force_close_keeps_queued_events(self):
+        release = asyncio.Event()
+
+        async def blocking_handler(event: ConnectionPollEvent):
+            await release.wait()
+
+        self.connection.event_bus.on(ConnectionPollEvent, blocking_handler, priority=10)
+
+        for n in range(3):
+            await self.connection._dispatch_poll_event(ConnectionPollEvent(PongEvent("pong", {"n": n})))
+            await asyncio.sleep(0)
+
+        await self.connection.force_close(close_session=False)
+
+        # Events received before the socket was closed are still dispatched.
+        release.set()
+
+        await self.wait_for_consumer()
+
+        self.assertEqual(self.received, list(range(3)))
+
+
+class TestConnectionNegotiation(unittest.IsolatedAsyncioTestCase):
+    async def connect(self, protocols=(), wire_format=WireFormat.JSON, compress=False):
+        async def handler(request):
+            ws = web.WebSocketResponse(protocols=protocols, compress=compress)
+            await ws.prepare(request)
+            await ws.receive()
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        connection = Connection()
+        connection.preferred_wire_format = wire_format
+        connection.compress_events = compress
+
+        await connection.connect(server.make_url("/"))
+        self.addAsyncCleanup(connection.force_close)
+
+        return connection
+
+    async def test_compression(self):
+        connection = await self.connect(compress=True)
+
+        self.assertEqual(connection.ws.compress, 15)
+        self.assertEqual(connection.ws._writer.compress, 0)
+
+    @unittest.skipUnless(WireFormat.MSGPACK.is_available(), "msgpack is not installed")
+    async def test_confirmed_wire_format(self):
+        connection = await self.connect(("msgpack",), WireFormat.MSGPACK)
+
+        self.assertTrue(connection.is_open())
+        self.assertIs(connection.wire_format, WireFormat.MSGPACK)
+
+    @unittest.skipUnless(WireFormat.MSGPACK.is_available(), "msgpack is not installed")
+    async def test_unconfirmed_wire_format(self):
+        # The server does not select the subprotocol, so JSON is used.
+        with self.assertLogs("websocket", "WARNING"):
+            connection = await self.connect((), WireFormat.MSGPACK)
+
+        self.assertTrue(connection.is_open())
+        self.assertIs(connection.wire_format, WireFormat.JSON)
+
+
+class TestClientEventBacklog(unittest.IsolatedAsyncioTestCase):
+    async def test_backlog_single_frame(self):
+        instance = SinglePrinter(config_manager=None, batch_client_events=True)
+        instance.client = client = FakeClient()
+
+        instance.backlog_client_event(PingEvent(), client)
+        instance.backlog_client_event(MeshDataEvent({"a": 1}), client)
+        instance.backlog_client_event(LogsSentEvent({"b": 2}), client)
+        instance.backlog_client_event(MeshDataEvent({"a": 2}), client)
+
+        # Pings are dropped and only the latest event of a type is kept.
+        self.assertEqual([event.data for event, _ in instance.client_event_backlog], [{"b": 2}, {"a": 2}])
+
+        instance.connection.ws = ws = FakeWebSocket()
+
+        await instance.on_connect(ConnectionConnectedEvent())
+
+        self.assertEqual(instance.client_event_backlog, [])
+        self.assertEqual(len(ws.frames), 1)
+        self.assertEqual(orjson.loads(ws.frames[0][1]),
+                         [{"type": "logs_sent", "data": {"b": 2}}, {"type": "mesh_data", "data": {"a": 2}}])
+
+    async def test_backlog_requires_batching(self):
+        instance = SinglePrinter(config_manager=None)
+        instance.client = client = FakeClient()
+        instance.connection.send_event = AsyncMock()
+
+        # Without batching events sent while disconnected are dropped, state is resent on connect.
+        await instance.on_client_event(MeshDataEvent({"a": 1}), client)
+
+        self.assertEqual(instance.client_event_backlog, [])
+        instance.connection.send_event.assert_awaited_once()
+
+    async def test_backlog_kept_while_disconnected(self):
+        instance = SinglePrinter(config_manager=None, batch_client_events=True)
+        instance.client = client = FakeClient()
+
+        instance.backlog_client_event(MeshDataEvent({"a": 1}), client)
+
+        await instance.consume_client_event_backlog(client)
+
+        self.assertEqual(len(instance.client_event_backlog), 1)
+
+    async def test_backlog_per_client(self):
+        instance = SinglePrinter(config_manager=None, batch_client_events=True)
+        client, other_client = FakeClient(), FakeClient()
+
+        instance.backlog_client_event(MeshDataEvent({"a": 1}), client)
+        instance.backlog_client_event(MeshDataEvent({"a": 2}), other_client)
+        instance.backlog_client_event(LogsSentEvent({"b": 1}), client)
+
+        instance.connection.ws = ws = FakeWebSocket()
+
+        await instance.consume_client_event_backlog(client)
+
+        # Only the events of the given client are sent.
+        self.assertEqual(orjson.loads(ws.frames[0][1]),
+                         [{"type": "mesh_data", "data": {"a": 1}}, {"type": "logs_sent", "data": {"b": 1}}])
+        self.assertEqual([(event.data, backlogged_client) for event, backlogged_client in instance.client_event_backlog],
+                         [({"a": 2}, other_client)])
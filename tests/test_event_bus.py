@@ -159,6 +159,19 @@ class TestEventBus(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result, 1337)
 
+    async def test_emit_without_listeners(self):
+        event_bus = DefaultEventBus()
+
+        self.assertFalse(event_bus.has_listeners(CustomEvent))
+
+        # Emitting without listeners completes immediately.
+        await event_bus.emit(CustomEvent())
+        self.assertTrue(event_bus.emit_task(CustomEvent()).done())
+
+        event_bus.on(CustomEvent, self.on_always)
+
+        self.assertTrue(event_bus.has_listeners(CustomEvent))
+
     def test_event_listener_adding(self):
         event_listeners = EventBusListeners()
 
@@ -0,0 +1,16 @@
+import unittest
+
+from simplyprint_ws_client.client.protocol import EventFactory, Demands, Events
+
+
+class TestEventFactory(unittest.TestCase):
+    def test_get_event(self):
+        self.assertIsInstance(EventFactory.get_event("pong"), Events.PongEvent)
+        self.assertIsInstance(EventFactory.get_event("demand", "pause", {"demand": "pause"}), Demands.PauseEvent)
+
+    def test_unknown_event(self):
+        self.assertIsNone(EventFactory.try_get_event("unknown"))
+        self.assertIsNone(EventFactory.try_get_event("demand"))
+        self.assertIsNone(EventFactory.try_get_event("demand", "unknown"))
+
+        self.assertRaises(KeyError, lambda: EventFactory.get_event("demand", "unknown"))